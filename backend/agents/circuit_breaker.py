@@ -0,0 +1,53 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures (errors or slow calls) for one backend.
+    After `failure_threshold` of them the circuit opens and the backend is
+    skipped for `cooldown` seconds, then a single trial call is allowed;
+    other callers stay blocked until that trial reports back.
+    """
+
+    def __init__(self, name, failure_threshold=3, latency_threshold=15.0, cooldown=300.0, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.latency_threshold = latency_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            # Half-open: let exactly one call through once the cooldown has passed
+            if self.trial_in_flight or self.clock() - self.opened_at < self.cooldown:
+                return False
+            self.trial_in_flight = True
+            return True
+
+    def record_success(self, elapsed):
+        if elapsed > self.latency_threshold:
+            logger.warning(f"[{self.name}] Slow response ({elapsed:.1f}s > {self.latency_threshold:.1f}s).")
+            self.record_failure()
+            return
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning(f"[{self.name}] Circuit opened after {self.failures} consecutive failures.")
+                self.opened_at = self.clock()
@@ -1,94 +1,101 @@
 import logging
 import os
-import google.generativeai as genai
+import time
 from dotenv import load_dotenv
+from agents.circuit_breaker import CircuitBreaker
+from agents.summarizers import GeminiSummarizer, ExtractiveSummarizer
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 class ContentProcessor:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, backends=None, time_budget=None, clock=time.monotonic):
+        """
+        :param api_key: Gemini API key (defaults to GEMINI_API_KEY).
+        :param backends: Ordered list of Summarizer instances to try. Defaults to
+                         Gemini followed by the local extractive summarizer.
+                         SUMMARIZER_BACKEND=local forces the local one only.
+        :param time_budget: Seconds allowed per digest run (see start_run), shared
+                            by every process() call in it. Once spent,
+                            remaining articles are summarized locally.
+        """
+        self.clock = clock
+        self.deadline = None
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
-        if not self.api_key:
-            logger.warning("GEMINI_API_KEY is not set. Content processing will fail.")
-        else:
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-2.0-flash') # Using Flash for speed/cost
+        self.time_budget = time_budget if time_budget is not None else float(os.getenv('SUMMARIZER_TIME_BUDGET', '600'))
+
+        if backends is None:
+            backends = []
+            if os.getenv('SUMMARIZER_BACKEND', 'auto') != 'local':
+                if not self.api_key:
+                    logger.warning("GEMINI_API_KEY is not set. Falling back to local summarization.")
+                backends.append(GeminiSummarizer(api_key=self.api_key))
+            backends.append(ExtractiveSummarizer())
+
+        self.backends = [b for b in backends if b.is_available()]
+        self.breakers = {b.name: CircuitBreaker(b.name) for b in self.backends}
+        # Always-available last resort used when the time budget runs out
+        self.local_backend = next((b for b in self.backends if isinstance(b, ExtractiveSummarizer)), None)
+
+    def start_run(self):
+        """Starts the time budget for a digest run spanning several process() calls."""
+        self.deadline = self.clock() + self.time_budget
 
     def process(self, articles):
         """
         Process a list of articles: Summarize and Score.
         Returns a list of processed article objects.
         """
-        if not self.api_key:
-            logger.error("Skipping processing due to missing API Key.")
+        if not self.backends:
+            logger.error("Skipping processing: no summarizer backend available.")
             return []
 
+        for backend in self.backends:
+            backend.prepare(articles)
+
+        # Without an explicit start_run(), the budget starts with the first call
+        if self.deadline is None:
+            self.start_run()
+
         processed_results = []
-        
-        # Batch processing or individual? 
-        # For better quality, individual or small batches are better. 
+
         # Let's do a loop for MVP (optimization: parallelize later).
-        
         for article in articles:
+            out_of_time = self.clock() > self.deadline
             try:
-                result = self._summarize_article(article)
+                result = self._summarize_article(article, out_of_time)
                 if result:
                     processed_results.append(result)
             except Exception as e:
                 logger.error(f"Failed to process article {article['title']}: {e}")
-        
+
         return processed_results
 
-    def _summarize_article(self, article):
-        prompt = f"""
-        You are a professional news analyst. Summarize the following news article into exactly 3 bullet points (Japanese).
-        Also, assign a "Reliability Score" from 1 to 10 based on the source and content clarity.
-        
-        Title: {article['title']}
-        Source: {article['source']}
-        
-        Output format:
-        Summary: 
-        - Point 1
-        - Point 2
-        - Point 3
-        Score: X/10
-        """
-        
-        # In a real app, we would fetch the full content of the article using 'article['link']'.
-        # For this MVP, we are summarizing based on the Title (and snippet if available) 
-        # because scraping full content is complex/timely.
-        # We will assume the title gives enough context for a "Headlines" summary.
-        
-        response = self.model.generate_content(prompt)
-        text = response.text
-        
-        # Simple parsing (robust parsing would use JSON mode)
-        summary = "No summary available."
-        score = 5
-        
-        try:
-            lines = text.split('\n')
-            summary_lines = [l for l in lines if l.strip().startswith('-') or l.strip().startswith('•')]
-            summary = "\n".join(summary_lines[:3]) # Take top 3
-            
-            # Extract score
-            for line in lines:
-                if 'Score:' in line:
-                    score_part = line.split('Score:')[1].strip().split('/')[0]
-                    score = int(score_part)
-        except:
-            pass
-
-        return {
-            'title': article['title'],
-            'link': article['link'],
-            'summary': summary,
-            'score': score,
-            'genre': article['genre'],
-            'source': article['source']
-        }
+    def _summarize_article(self, article, out_of_time=False):
+        """Try each backend in order, skipping those whose circuit is open."""
+        if out_of_time and self.local_backend:
+            return self.local_backend.summarize(article)
+
+        last_error = None
+        for backend in self.backends:
+            breaker = self.breakers[backend.name]
+            if not breaker.allow_request():
+                continue
+
+            started = self.clock()
+            try:
+                result = backend.summarize(article)
+            except Exception as e:
+                breaker.record_failure()
+                logger.warning(f"[{backend.name}] Failed on {article['title']}: {e}")
+                last_error = e
+                continue
+            breaker.record_success(self.clock() - started)
+            return result
+
+        if last_error:
+            raise last_error
+        return None
 
 if __name__ == "__main__":
     # Test
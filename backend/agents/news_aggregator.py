@@ -1,11 +1,15 @@
-import feedparser
 import logging
-import datetime
+import urllib.parse
+import urllib.request
+from agents.rss_parser import GoogleNewsRSSParser
 
 logger = logging.getLogger(__name__)
 
 class NewsAggregator:
-    def __init__(self):
+    def __init__(self, max_items_per_feed=3, timeout=10):
+        self.timeout = timeout
+        # Top N entries per category (reduced from 5 to avoid overload with many categories)
+        self.parser = GoogleNewsRSSParser(max_items=max_items_per_feed)
         self.base_url = "https://news.google.com/rss"
         # Define feeds/queries for each genre
         self.feeds = {
@@ -28,6 +32,8 @@ class NewsAggregator:
         ceid = 'JP:ja' if lang == 'ja' else 'US:en'
         hl = 'ja' if lang == 'ja' else 'en-US'
         gl = 'JP' if lang == 'ja' else 'US'
+        # Percent-encode non-ASCII topics (e.g. 大谷翔平); '+' stays as the word separator
+        query = urllib.parse.quote(query, safe='+')
         return f"{self.base_url}/search?q={query}&hl={hl}&gl={gl}&ceid={ceid}"
 
     def collect_news(self, selected_genres=None, custom_topics=None):
@@ -71,19 +77,17 @@ class NewsAggregator:
     def _fetch_and_append(self, feed_url, articles_list, genre_label):
         """Helper to fetch feed and append to list"""
         try:
-            feed = feedparser.parse(feed_url)
-            # Extract top 3 entries per category (reduced from 5 to avoid overload with many categories)
-            for entry in feed.entries[:3]:
-                articles_list.append({
-                    'title': entry.title,
-                    'link': entry.link,
-                    'published': entry.get('published', datetime.datetime.now().isoformat()),
-                    'source': entry.get('source', {}).get('title', 'Unknown'),
-                    'genre': genre_label
-                })
+            data = self._download(feed_url)
+            articles_list.extend(self.parser.parse(data, genre_label))
         except Exception as e:
             logger.error(f"Error fetching feed {genre_label}: {e}")
 
+    def _download(self, feed_url):
+        """Fetch the raw feed body as bytes"""
+        req = urllib.request.Request(feed_url, headers={'User-Agent': 'Mozilla/5.0 (Morning5 NewsAggregator)'})
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return resp.read()
+
 if __name__ == "__main__":
     # Simple test
     logging.basicConfig(level=logging.INFO)
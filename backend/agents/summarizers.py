@@ -0,0 +1,165 @@
+import logging
+import math
+import re
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+class Summarizer:
+    """
+    Base interface for summarization backends.
+    summarize() returns a processed article dict or raises on failure.
+    """
+    name = 'base'
+
+    def is_available(self):
+        return True
+
+    def prepare(self, articles):
+        """Optional hook called once with the whole batch before summarizing."""
+        pass
+
+    def summarize(self, article):
+        raise NotImplementedError
+
+    def _build_result(self, article, summary, score):
+        return {
+            'title': article['title'],
+            'link': article['link'],
+            'summary': summary,
+            'score': score,
+            'genre': article['genre'],
+            'source': article['source']
+        }
+
+class GeminiSummarizer(Summarizer):
+    name = 'gemini'
+
+    def __init__(self, api_key=None, model_name='gemini-2.0-flash', timeout=30):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.model = None
+        if self.api_key:
+            # Imported lazily so the local backend works without the Gemini SDK
+            import google.generativeai as genai
+            genai.configure(api_key=self.api_key)
+            self.model = genai.GenerativeModel(model_name) # Using Flash for speed/cost
+
+    def is_available(self):
+        return self.model is not None
+
+    def summarize(self, article):
+        prompt = f"""
+        You are a professional news analyst. Summarize the following news article into exactly 3 bullet points (Japanese).
+        Also, assign a "Reliability Score" from 1 to 10 based on the source and content clarity.
+
+        Title: {article['title']}
+        Source: {article['source']}
+
+        Output format:
+        Summary:
+        - Point 1
+        - Point 2
+        - Point 3
+        Score: X/10
+        """
+
+        # In a real app, we would fetch the full content of the article using 'article['link']'.
+        # For this MVP, we are summarizing based on the Title (and snippet if available)
+        # because scraping full content is complex/timely.
+        # We will assume the title gives enough context for a "Headlines" summary.
+
+        response = self.model.generate_content(prompt, request_options={'timeout': self.timeout})
+        text = response.text
+
+        # Simple parsing (robust parsing would use JSON mode)
+        summary = "No summary available."
+        score = 5
+
+        try:
+            lines = text.split('\n')
+            summary_lines = [l for l in lines if l.strip().startswith('-') or l.strip().startswith('•')]
+            summary = "\n".join(summary_lines[:3]) # Take top 3
+
+            # Extract score
+            for line in lines:
+                if 'Score:' in line:
+                    score_part = line.split('Score:')[1].strip().split('/')[0]
+                    score = int(score_part)
+        except:
+            pass
+
+        return self._build_result(article, summary, score)
+
+class ExtractiveSummarizer(Summarizer):
+    """
+    CPU-only fallback: picks the highest TF-IDF scoring sentences from the
+    article's title and snippet. IDF is computed over the current batch.
+    """
+    name = 'local'
+
+    # Sentence boundaries for both Japanese and English text, the
+    # " - Source" separator Google News appends to headlines, and the
+    # one-headline-per-line snippets built by GoogleNewsRSSParser.
+    SENTENCE_SPLIT = re.compile(r'(?<=[。．！？!?])\s*|(?<=\.)\s+|\s+[-|｜]\s+|\n')
+    LATIN_TOKEN = re.compile(r'[A-Za-z0-9]+')
+    CJK_RUN = re.compile(r'[\u3040-\u30ff\u3400-\u9fff\uff66-\uff9f]+')
+    # Score assigned to local summaries; the heuristic cannot judge reliability
+    DEFAULT_SCORE = 5
+
+    def __init__(self, max_sentences=3):
+        self.max_sentences = max_sentences
+        self.idf = {}
+        self.default_idf = 1.0
+
+    def prepare(self, articles):
+        doc_freq = Counter()
+        for article in articles:
+            doc_freq.update(set(self._tokenize(self._article_text(article))))
+        total = len(articles)
+        # Smoothed IDF so terms unseen in the batch still get a sane weight
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in doc_freq.items()}
+        self.default_idf = math.log(1 + total) + 1
+
+    def summarize(self, article):
+        sentences = self._split_sentences(article)
+        ranked = sorted(enumerate(sentences), key=lambda pair: self._score_sentence(pair[1]), reverse=True)
+        # Keep the chosen sentences in their original order
+        chosen = sorted(ranked[:self.max_sentences])
+        summary = "\n".join(f"- {sentence}" for _, sentence in chosen) or "No summary available."
+        return self._build_result(article, summary, self.DEFAULT_SCORE)
+
+    def _article_text(self, article):
+        return f"{article.get('title', '')} {article.get('snippet', '')}"
+
+    def _split_sentences(self, article):
+        title = article.get('title', '')
+        source = article.get('source', '')
+        # Drop the trailing " - Source" Google News appends to each headline
+        if source and title.endswith(f" - {source}"):
+            title = title[:-len(f" - {source}")]
+
+        sentences = []
+        for text in (title, article.get('snippet', '')):
+            for sentence in self.SENTENCE_SPLIT.split(text or ''):
+                sentence = sentence.strip()
+                if sentence and sentence not in sentences:
+                    sentences.append(sentence)
+        return sentences
+
+    def _tokenize(self, text):
+        tokens = [t.lower() for t in self.LATIN_TOKEN.findall(text)]
+        # Japanese has no word boundaries; character bigrams are a cheap stand-in
+        for run in self.CJK_RUN.findall(text):
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        return tokens
+
+    def _score_sentence(self, sentence):
+        tokens = self._tokenize(sentence)
+        if not tokens:
+            return 0.0
+        tf = Counter(tokens)
+        return sum(count * self.idf.get(term, self.default_idf) for term, count in tf.items()) / len(tokens)
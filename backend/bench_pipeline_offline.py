@@ -0,0 +1,45 @@
+import glob
+import os
+import sys
+import time
+from agents.rss_parser import GoogleNewsRSSParser
+from agents.content_processor import ContentProcessor
+from agents.summarizers import ExtractiveSummarizer
+
+# Simulated feeds per digest run (12 genres x a couple dozen users)
+FEEDS_PER_RUN = 300
+
+def load_fixtures():
+    fixture_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+    fixtures = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, 'google_news_*.xml'))):
+        with open(path, 'rb') as f:
+            fixtures.append(f.read())
+    return fixtures
+
+def main():
+    """Runs parse -> summarize over saved fixtures with the local backend only (no network)."""
+    fixtures = load_fixtures()
+    if not fixtures:
+        print("[ERROR] No fixtures found in backend/fixtures/.")
+        sys.exit(1)
+
+    print(f"--- Offline Pipeline Benchmark ({FEEDS_PER_RUN} feeds, local summarizer) ---")
+    parser = GoogleNewsRSSParser(max_items=3)
+    processor = ContentProcessor(backends=[ExtractiveSummarizer()])
+
+    start = time.perf_counter()
+    articles = []
+    for i in range(FEEDS_PER_RUN):
+        articles.extend(parser.parse(fixtures[i % len(fixtures)], f"bench_{i}"))
+    parsed = time.perf_counter()
+
+    results = processor.process(articles)
+    done = time.perf_counter()
+
+    print(f"Parse:     {(parsed - start) * 1000:8.1f} ms ({len(articles)} articles)")
+    print(f"Summarize: {(done - parsed) * 1000:8.1f} ms ({len(results)} summaries)")
+    print(f"Total:     {(done - start) * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import glob
+import os
+import sys
+import time
+import tracemalloc
+import feedparser
+from agents.news_aggregator import NewsAggregator
+from agents.rss_parser import GoogleNewsRSSParser
+
+# Number of feed parses per run (roughly "hundreds of feeds per digest run")
+FEEDS_PER_RUN = 300
+MAX_ITEMS = 3
+
+def load_fixtures():
+    fixture_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+    paths = sorted(glob.glob(os.path.join(fixture_dir, 'google_news_*.xml')))
+    fixtures = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            fixtures.append(f.read())
+    return fixtures
+
+def parse_with_feedparser(data):
+    feed = feedparser.parse(data)
+    return [(e.title, e.link, e.get('published'), e.get('source', {}).get('title')) for e in feed.entries[:MAX_ITEMS]]
+
+def parse_with_fast_parser(parser, data):
+    return parser.parse(data, 'bench')
+
+def measure(label, func, fixtures):
+    # Warm up (imports, caches) so they do not count against either parser
+    func(fixtures[0])
+
+    # CPU: timed without tracemalloc, which would skew the numbers
+    start = time.perf_counter()
+    for i in range(FEEDS_PER_RUN):
+        func(fixtures[i % len(fixtures)])
+    elapsed = time.perf_counter() - start
+
+    # Memory: peak allocation while parsing each fixture once
+    tracemalloc.start()
+    for data in fixtures:
+        func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<12} total: {elapsed * 1000:8.1f} ms | per feed: {elapsed / FEEDS_PER_RUN * 1000:6.3f} ms | peak mem: {peak / 1024:8.1f} KiB")
+    return elapsed, peak
+
+def main():
+    fixtures = load_fixtures()
+    if not fixtures:
+        print("[ERROR] No fixtures found in backend/fixtures/.")
+        sys.exit(1)
+
+    print(f"--- RSS Parser Benchmark ({FEEDS_PER_RUN} feeds, {len(fixtures)} fixture(s), top {MAX_ITEMS} items) ---")
+    parser = GoogleNewsRSSParser(max_items=MAX_ITEMS)
+
+    # Sanity check: both paths must agree on the fields the aggregator uses
+    for data in fixtures:
+        expected = parse_with_feedparser(data)
+        actual = [(a['title'], a['link'], a['published'], a['source']) for a in parse_with_fast_parser(parser, data)]
+        if expected != actual:
+            print("[ERROR] Fast parser output differs from feedparser.")
+            print(f"feedparser: {expected}")
+            print(f"fast:       {actual}")
+            sys.exit(1)
+    print("[OK] Outputs match feedparser.")
+
+    # The fast path and the feedparser fallback must build identical records
+    # (snippets included) for every item, not just the top few
+    full_parser = GoogleNewsRSSParser(max_items=1000)
+    for data in fixtures:
+        fast = full_parser._parse_fast(data, 'bench')
+        fallback = full_parser._parse_fallback(data, 'bench')
+        if fast != fallback:
+            mismatch = next((pair for pair in zip(fast, fallback) if pair[0] != pair[1]), (len(fast), len(fallback)))
+            print("[ERROR] Fast path and feedparser fallback disagree.")
+            print(f"fast:     {mismatch[0]}")
+            print(f"fallback: {mismatch[1]}")
+            sys.exit(1)
+    print("[OK] Fast path matches the feedparser fallback on all items.")
+
+    # Custom topics are usually Japanese; the request URL must be ASCII-only
+    for topic in ('ラーメン', '大谷翔平', 'SpaceX Starship'):
+        url = NewsAggregator()._build_search_url(topic, 'ja')
+        if not url.isascii():
+            print(f"[ERROR] Search URL is not percent-encoded: {url}")
+            sys.exit(1)
+    print("[OK] Non-ASCII custom topic URLs are percent-encoded.")
+
+    slow_time, slow_peak = measure('feedparser', parse_with_feedparser, fixtures)
+    fast_time, fast_peak = measure('fast', lambda d: parse_with_fast_parser(parser, d), fixtures)
+
+    print(f"\nSpeedup: {slow_time / fast_time:.1f}x CPU | {slow_peak / max(fast_peak, 1):.1f}x less peak memory")
+
+if __name__ == "__main__":
+    main()
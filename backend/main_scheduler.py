@@ -184,6 +184,8 @@ def process_daily_digest():
         email_service = EmailService(provider='gmail')
         aggregator = NewsAggregator()
         processor = ContentProcessor()
+        # One summarization time budget for the whole run, across all users
+        processor.start_run()
 
         for user in users_settings:
             user_id = user['id']
@@ -221,21 +223,11 @@ def process_daily_digest():
             if not processed_content:
                  continue
 
-            # 4. Create HTML Body
-            html_body = "<h1>Morning 5 Daily Digest</h1><hr>"
-            for article in processed_content:
-                html_body += f"""
-                <div style='margin-bottom: 20px; padding: 10px; background-color: #f9f9f9; border-left: 4px solid #3498db;'>
-                    <h3 style='margin-top: 0;'><a href="{article['link']}">{article['title']}</a></h3>
-                    <p style='color: #555; font-size: 14px;'>Score: <b>{article['score']}/10</b> | Source: {article['source']}</p>
-                    <div style='background-color: white; padding: 10px; border-radius: 5px;'>
-                        {article['summary'].replace(chr(10), '<br>')}
-                    </div>
-                </div>
-                """
+            # 4. Render HTML + plain-text bodies
+            html_body, text_body = email_service.render_digest(processed_content)
             
             # 5. Send Email
-            email_service.send_daily_digest(recipients, html_body)
+            email_service.send_daily_digest(recipients, html_body, text_body)
             logger.info(f"Sent digest to {len(recipients)} recipients for user {user_id}.")
 
         logger.info("Daily Digest Process Completed Successfully.")
@@ -0,0 +1,82 @@
+import logging
+import datetime
+import os
+from collections import OrderedDict
+from email.header import Header
+from email.message import Message
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates', 'email')
+
+class EmailRenderer:
+    """
+    Renders digest emails from precompiled Jinja templates and caches the
+    encoded MIME body per distinct digest, so that sending the same digest
+    to many recipients only builds the From/To/Subject headers per send.
+    """
+
+    # Shared across instances: templates are compiled once per process
+    _env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(['html']),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+    def __init__(self, cache_size=32):
+        self.html_template = self._env.get_template('digest.html')
+        self.text_template = self._env.get_template('digest.txt')
+        self.cache_size = cache_size
+        self._body_cache = OrderedDict()
+
+    def render(self, articles, read_more=False):
+        """
+        Renders the digest for a list of article dicts.
+        read_more adds a "Read full article" link under each summary instead
+        of linking the title.
+        Returns (html_body, text_body).
+        """
+        context = {
+            'articles': articles,
+            'read_more': read_more,
+            'today': datetime.datetime.now().strftime("%Y-%m-%d"),
+        }
+        return self.html_template.render(context), self.text_template.render(context)
+
+    def build_message(self, sender, to_email, subject, html_body, text_body=None):
+        """
+        Returns the full message as a string, reusing the cached MIME body.
+        Without text_body the message is a single text/html part.
+        """
+        headers = Message()
+        headers['From'] = sender
+        headers['To'] = to_email
+        headers['Subject'] = subject if subject.isascii() else Header(subject, 'utf-8')
+        # as_string() ends the header block with a blank line; the cached
+        # body starts with its own Content-Type/MIME-Version headers.
+        return headers.as_string().rstrip('\n') + '\n' + self._encoded_body(html_body, text_body)
+
+    def _encoded_body(self, html_body, text_body):
+        key = (html_body, text_body)
+        cached = self._body_cache.get(key)
+        if cached is not None:
+            self._body_cache.move_to_end(key)
+            return cached
+
+        if text_body is None:
+            msg = MIMEText(html_body, 'html')
+        else:
+            msg = MIMEMultipart('alternative')
+            # Clients show the last part they support, so HTML goes last
+            msg.attach(MIMEText(text_body, 'plain'))
+            msg.attach(MIMEText(html_body, 'html'))
+
+        encoded = msg.as_string()
+        self._body_cache[key] = encoded
+        if len(self._body_cache) > self.cache_size:
+            self._body_cache.popitem(last=False)
+        return encoded
@@ -1,57 +1,49 @@
 import logging
-import datetime
 import smtplib
 import os
 from dotenv import load_dotenv
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from services.email_renderer import EmailRenderer
 
 load_dotenv() # Load environment variables
 
 logger = logging.getLogger(__name__)
 
 class EmailService:
-    def __init__(self, provider='mock', sender_email=None, password=None):
+    def __init__(self, provider='mock', sender_email=None, password=None, max_per_session=100):
         self.provider = provider
+        # Messages sent per SMTP session before reconnecting (Gmail drops long sessions)
+        self.max_per_session = max_per_session
         self.sender_email = sender_email or os.getenv('GMAIL_SENDER')
         self.password = password or os.getenv('GMAIL_APP_PASSWORD')
+        self.renderer = EmailRenderer()
         
     def format_email_content(self, title, summary):
         """
         Creates a simple HTML template for the email.
         """
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
-        html_content = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; color: #333;">
-            <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                <h1 style="color: #2c3e50;">Morning 5 Daily Digest</h1>
-                <p style="color: #7f8c8d;">{today}</p>
-                <hr>
-                
-                <div style="background-color: #f9f9f9; padding: 15px; border-radius: 5px; margin-bottom: 20px;">
-                    <h2 style="margin-top: 0;">{title}</h2>
-                    <p style="line-height: 1.6;">{summary}</p>
-                    <a href="#" style="color: #3498db; text-decoration: none;">Read full article</a>
-                </div>
-
-                <div style="font-size: 12px; color: #999; text-align: center; margin-top: 30px;">
-                    <p>You received this email because you are subscribed to Morning 5.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        html_content, _ = self.renderer.render([{'title': title, 'summary': summary, 'link': '#'}], read_more=True)
         return html_content
 
-    def send_daily_digest(self, recipients, content):
+    def render_digest(self, articles):
+        """
+        Renders processed articles into (html_body, text_body).
+        """
+        return self.renderer.render(articles)
+
+    def send_daily_digest(self, recipients, content, text_content=None):
         """
         Sends the digest to a list of recipients.
+        The encoded body is built once and SMTP sessions are reused.
         """
-        for recipient in recipients:
-            self.send_email(recipient, "Morning 5 Daily Digest", content)
+        subject = "Morning 5 Daily Digest"
+        if self.provider != 'gmail':
+            for recipient in recipients:
+                self.send_email(recipient, subject, content, text_content)
+            return
+
+        self._send_batch(recipients, subject, content, text_content)
 
-    def send_email(self, to_email, subject, body):
+    def send_email(self, to_email, subject, body, text_body=None):
         """
         Sends a single email. 
         """
@@ -66,31 +58,102 @@ class EmailService:
             return True
 
         elif self.provider == 'gmail':
-            if not self.sender_email or not self.password:
-                logger.error("Gmail credentials (sender_email, password) are missing.")
-                return False
-
-            try:
-                msg = MIMEMultipart()
-                msg['From'] = self.sender_email
-                msg['To'] = to_email
-                msg['Subject'] = subject
-                msg.attach(MIMEText(body, 'html'))
-
-                # Connect to Gmail SMTP Server
-                server = smtplib.SMTP('smtp.gmail.com', 587)
-                server.starttls()
-                server.login(self.sender_email, self.password)
-                text = msg.as_string()
-                server.sendmail(self.sender_email, to_email, text)
-                server.quit()
-                
-                logger.info(f"[GMAIL] Email sent successfully to {to_email}")
-                return True
-            except Exception as e:
-                logger.error(f"[GMAIL] Failed to send email: {str(e)}")
-                return False
+            return self._send_batch([to_email], subject, body, text_body) == 1
 
         else:
             logger.warning(f"Provider {self.provider} not supported.")
             return False
+
+    def _send_batch(self, recipients, subject, body, text_body=None):
+        """
+        Sends one message per recipient over shared SMTP sessions.
+        A dropped session is reopened and that recipient retried once.
+        If a session cannot be opened (e.g. bad app password) the batch is
+        aborted rather than retrying the login for every recipient.
+        Returns the number of messages sent.
+        """
+        if not self.sender_email or not self.password:
+            logger.error("Gmail credentials (sender_email, password) are missing.")
+            return 0
+
+        sent = 0
+        server = None
+        session_sent = 0
+        try:
+            for index, recipient in enumerate(recipients):
+                if server is not None and session_sent >= self.max_per_session:
+                    self._disconnect(server)
+                    server = None
+
+                for attempt in range(2):
+                    if server is None:
+                        server = self._connect()
+                        session_sent = 0
+                        if server is None:
+                            logger.error(f"[GMAIL] Aborting batch: {len(recipients) - index} recipient(s) not sent.")
+                            return sent
+                    try:
+                        self._send_via(server, recipient, subject, body, text_body)
+                        sent += 1
+                        session_sent += 1
+                        break
+                    except smtplib.SMTPException as e:
+                        if not self._is_session_lost(e):
+                            # Rejected message; the session itself is still usable
+                            logger.error(f"[GMAIL] Failed to send email to {recipient}: {str(e)}")
+                            break
+                        error = e
+                    except OSError as e:
+                        error = e
+
+                    self._close(server)
+                    server = None
+                    if attempt == 0:
+                        logger.warning(f"[GMAIL] SMTP session lost while sending to {recipient} ({str(error)}). Reconnecting.")
+                    else:
+                        logger.error(f"[GMAIL] Failed to send email to {recipient}: {str(error)}")
+        finally:
+            if server is not None:
+                self._disconnect(server)
+        return sent
+
+    def _is_session_lost(self, error):
+        """
+        True when the server has closed the session. smtplib closes the
+        connection itself on 421 (Gmail's rate-limit reply) before raising.
+        """
+        if isinstance(error, smtplib.SMTPRecipientsRefused):
+            return any(code == 421 for code, _ in error.recipients.values())
+        if isinstance(error, smtplib.SMTPResponseException):
+            return error.smtp_code == 421
+        return True
+
+    def _connect(self):
+        """Opens an authenticated Gmail SMTP session, or returns None."""
+        try:
+            # Connect to Gmail SMTP Server
+            server = smtplib.SMTP('smtp.gmail.com', 587)
+            server.starttls()
+            server.login(self.sender_email, self.password)
+            return server
+        except Exception as e:
+            logger.error(f"[GMAIL] Failed to connect: {str(e)}")
+            return None
+
+    def _disconnect(self, server):
+        try:
+            server.quit()
+        except Exception as e:
+            logger.warning(f"[GMAIL] Error closing SMTP session: {str(e)}")
+
+    def _close(self, server):
+        """Drops a broken session without the QUIT round trip."""
+        try:
+            server.close()
+        except Exception:
+            pass
+
+    def _send_via(self, server, to_email, subject, body, text_body=None):
+        text = self.renderer.build_message(self.sender_email, to_email, subject, body, text_body)
+        server.sendmail(self.sender_email, to_email, text)
+        logger.info(f"[GMAIL] Email sent successfully to {to_email}")
@@ -1,6 +1,8 @@
 import logging
 import sys
+from agents.circuit_breaker import CircuitBreaker
 from agents.content_processor import ContentProcessor
+from agents.summarizers import Summarizer, ExtractiveSummarizer
 
 # Configure logging
 logging.basicConfig(
@@ -9,13 +11,110 @@ logging.basicConfig(
     handlers=[logging.StreamHandler(sys.stdout)]
 )
 
+class StubSummarizer(Summarizer):
+    """Stand-in for a remote backend: counts calls and optionally fails."""
+    name = 'stub'
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = 0
+
+    def summarize(self, article):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("429 Resource has been exhausted")
+        return self._build_result(article, "- stub summary", 8)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def make_articles(count):
+    return [{
+        'title': f'Toyota battery news {i} - TechDaily',
+        'snippet': 'Solid state batteries charge faster. Production starts in 2027.',
+        'source': 'TechDaily',
+        'link': f'http://example.com/{i}',
+        'genre': 'new_tech'
+    } for i in range(count)]
+
+def check(label, condition):
+    print(f"[{'OK' if condition else 'FAILURE'}] {label}")
+    return condition
+
+def run_fallback_checks():
+    """Offline checks for the circuit breaker and time budget (no network)."""
+    print("\n--- Fallback Checks (stub backend + local summarizer) ---")
+    ok = True
+
+    # 1. Breaker opens after 3 consecutive failures; articles go to the local backend
+    clock = FakeClock()
+    stub = StubSummarizer(fail=True)
+    processor = ContentProcessor(backends=[stub, ExtractiveSummarizer()])
+    processor.breakers['stub'] = CircuitBreaker('stub', failure_threshold=3, cooldown=60, clock=clock)
+    results = processor.process(make_articles(5))
+    ok &= check("All 5 articles summarized while the stub backend fails", len(results) == 5)
+    ok &= check("Stub backend skipped after 3 failures", stub.calls == 3)
+
+    # 2. Still open before the cooldown, one trial call after it, then open again
+    clock.now = 30
+    processor.process(make_articles(1))
+    ok &= check("No call while the circuit is open", stub.calls == 3)
+    clock.now = 61
+    processor.process(make_articles(2))
+    ok &= check("Exactly one trial call after the cooldown", stub.calls == 4)
+
+    # 3. A recovered backend closes the circuit again
+    stub.fail = False
+    clock.now = 200
+    results = processor.process(make_articles(2))
+    ok &= check("Circuit closes after a successful trial", stub.calls == 6 and results[-1]['summary'] == "- stub summary")
+
+    # 4. Half-open admits a single trial: concurrent callers are blocked until it reports
+    breaker = CircuitBreaker('trial', failure_threshold=1, cooldown=60, clock=clock)
+    breaker.record_failure()
+    clock.now += 61
+    first, second = breaker.allow_request(), breaker.allow_request()
+    ok &= check("Half-open lets exactly one caller through", first and not second)
+    breaker.record_success(0.1)
+    ok &= check("Circuit closes once the trial succeeds", breaker.allow_request())
+
+    # 5. Slow successes count as failures
+    breaker = CircuitBreaker('slow', failure_threshold=3, latency_threshold=1.0, clock=clock)
+    for _ in range(3):
+        breaker.record_success(5.0)
+    ok &= check("Circuit opens after 3 slow responses", not breaker.allow_request())
+
+    # 6. Once the time budget is spent, everything goes to the local backend
+    stub = StubSummarizer()
+    processor = ContentProcessor(backends=[stub, ExtractiveSummarizer()], time_budget=-1)
+    results = processor.process(make_articles(3))
+    ok &= check("Time budget exhausted: local backend used", stub.calls == 0 and len(results) == 3)
+
+    # 7. The budget is shared by every process() call in a run (one call per user)
+    clock = FakeClock()
+    stub = StubSummarizer()
+    processor = ContentProcessor(backends=[stub, ExtractiveSummarizer()], time_budget=10, clock=clock)
+    processor.start_run()
+    processor.process(make_articles(2))
+    clock.now = 11
+    results = processor.process(make_articles(2))
+    ok &= check("Second process() call in the run goes to the local backend after the shared budget", stub.calls == 2 and len(results) == 2 and results[0]['summary'] != "- stub summary")
+
+    return ok
+
 def main():
-    print("--- Starting Content Processor Test (Gemini API) ---")
+    # Pass --local to run the offline extractive summarizer (no API key / network needed)
+    local_only = '--local' in sys.argv
+    print(f"--- Starting Content Processor Test ({'Local' if local_only else 'Gemini API'}) ---")
     
     # 1. Initialize Processor
     # API Key is autoloaded from .env
     try:
-        processor = ContentProcessor()
+        processor = ContentProcessor(backends=[ExtractiveSummarizer()] if local_only else None)
         print("[OK] Processor initialized.")
     except Exception as e:
         print(f"[ERROR] Initialization failed: {e}")
@@ -48,5 +147,8 @@ def main():
     except Exception as e:
         print(f"\n[ERROR] Processing failed: {e}")
 
+    if local_only and not run_fallback_checks():
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()